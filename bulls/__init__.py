@@ -20,7 +20,16 @@ Usage:
 
 from bulls import data
 from bulls import analysis
-from bulls import graphics
 from bulls.config import BULLS_TEAM_ID, CURRENT_SEASON
 
 __version__ = "0.1.0"
+
+
+def __getattr__(name):
+    # graphics pulls in matplotlib.pyplot; load it on first use so data and
+    # analysis callers don't pay for it (or have a backend chosen for them).
+    if name == "graphics":
+        import importlib
+
+        return importlib.import_module("bulls.graphics")
+    raise AttributeError(f"module 'bulls' has no attribute {name!r}")
@@ -4,6 +4,11 @@ import numpy as np
 from typing import Optional, List, Dict
 
 
+_SEASON_AVERAGE_STATS = (
+    'points', 'rebounds', 'assists', 'steals', 'blocks', 'fg_pct', 'fg3_pct',
+)
+
+
 def season_averages(player_games: pd.DataFrame) -> dict:
     """
     Calculate a player's averages from their game log.
@@ -22,15 +27,10 @@ def season_averages(player_games: pd.DataFrame) -> dict:
     if player_games.empty:
         return {}
     
+    # One reduction over all stat columns instead of a mean() per column
     return {
         'games': len(player_games),
-        'points': player_games['points'].mean(),
-        'rebounds': player_games['rebounds'].mean(),
-        'assists': player_games['assists'].mean(),
-        'steals': player_games['steals'].mean(),
-        'blocks': player_games['blocks'].mean(),
-        'fg_pct': player_games['fg_pct'].mean(),
-        'fg3_pct': player_games['fg3_pct'].mean(),
+        **player_games[list(_SEASON_AVERAGE_STATS)].mean().to_dict(),
     }
 
 
@@ -83,15 +83,15 @@ def scoring_trend(
     if player_games.empty or metric not in player_games.columns:
         return {}
     
-    values = player_games[metric].tolist()
-    avg = sum(values) / len(values)
+    values = player_games[metric].to_numpy()
+    avg = float(values.mean())
     
-    # Recent trend (last 5 vs previous 5)
-    recent = values[:5] if len(values) >= 5 else values
-    previous = values[5:10] if len(values) >= 10 else values[len(recent):]
+    # Recent trend (last 5 vs previous 5); slicing past the end is just shorter
+    recent = values[:5]
+    previous = values[5:10]
     
-    recent_avg = sum(recent) / len(recent) if recent else 0
-    previous_avg = sum(previous) / len(previous) if previous else recent_avg
+    recent_avg = float(recent.mean())
+    previous_avg = float(previous.mean()) if previous.size else recent_avg
     
     if recent_avg > previous_avg * 1.1:
         direction = "up"
@@ -104,18 +104,31 @@ def scoring_trend(
         'direction': direction,
         'average': avg,
         'recent_avg': recent_avg,
-        'high': max(values),
-        'low': min(values),
-        'last_game': values[0] if values else 0,
+        'high': values.max().item(),
+        'low': values.min().item(),
+        'last_game': values[0].item(),
     }
 
 
-def top_performers(box_score: pd.DataFrame) -> list:
+# top_performers() output key -> box score column
+_PERFORMER_COUNTS = {
+    'points': 'points',
+    'rebounds': 'reboundsTotal',
+    'assists': 'assists',
+    'steals': 'steals',
+    'blocks': 'blocks',
+    'fg_made': 'fieldGoalsMade',
+    'fg_attempted': 'fieldGoalsAttempted',
+}
+
+
+def top_performers(box_score: pd.DataFrame, limit: Optional[int] = None) -> list:
     """
     Rank players by performance in a game.
     
     Args:
         box_score: DataFrame from get_box_score()
+        limit: If given, return only the top `limit` players
     
     Returns:
         List of dicts with player info, sorted by points (desc)
@@ -128,27 +141,29 @@ def top_performers(box_score: pd.DataFrame) -> list:
     if box_score.empty:
         return []
     
-    performers = []
-    
-    for _, row in box_score.iterrows():
-        performers.append({
-            'player_id': row.get('personId', 0),
-            'name': row.get('name', 'Unknown'),
-            'first_name': row.get('firstName', ''),
-            'last_name': row.get('familyName', ''),
-            'points': int(row.get('points', 0) or 0),
-            'rebounds': int(row.get('reboundsTotal', 0) or 0),
-            'assists': int(row.get('assists', 0) or 0),
-            'steals': int(row.get('steals', 0) or 0),
-            'blocks': int(row.get('blocks', 0) or 0),
-            'fg_made': int(row.get('fieldGoalsMade', 0) or 0),
-            'fg_attempted': int(row.get('fieldGoalsAttempted', 0) or 0),
-        })
+    def column(name, default):
+        if name in box_score.columns:
+            return box_score[name]
+        return pd.Series(default, index=box_score.index)
+
+    performers = pd.DataFrame({
+        'player_id': column('personId', 0),
+        'name': column('name', 'Unknown'),
+        'first_name': column('firstName', ''),
+        'last_name': column('familyName', ''),
+    })
+    for key, source in _PERFORMER_COUNTS.items():
+        performers[key] = column(source, 0).fillna(0).astype(int)
     
-    # Sort by points, then assists, then rebounds
-    performers.sort(key=lambda x: (x['points'], x['assists'], x['rebounds']), reverse=True)
+    # Sort by points, then assists, then rebounds (ties keep box-score order).
+    # With a limit, nlargest selects the top rows without sorting the whole box.
+    order = ['points', 'assists', 'rebounds']
+    if limit is not None:
+        performers = performers.nlargest(limit, order, keep='first')
+    else:
+        performers = performers.sort_values(order, ascending=False, kind='stable')
 
-    return performers
+    return performers.to_dict('records')
 
 
 def efficiency_metrics(player_games: pd.DataFrame) -> dict:
@@ -258,21 +273,18 @@ def rolling_averages(
     if windows is None:
         windows = [3, 5, 10]
 
-    df = player_games.copy()
-
-    # Data is most recent first, so we reverse for rolling calculation
-    # then reverse back to maintain original order
-    df_reversed = df.iloc[::-1].copy()
+    # Data is most recent first, so each metric is rolled over its reversed
+    # column; assignment aligns on the index, which puts the result back in
+    # original order without reversing (and copying) the whole frame.
+    result = player_games.reset_index(drop=True)
 
     for metric in metrics:
-        if metric not in df.columns:
+        if metric not in result.columns:
             continue
+        chronological = result[metric].iloc[::-1]
         for window in windows:
             col_name = f'{metric}_roll_{window}'
-            df_reversed[col_name] = df_reversed[metric].rolling(window=window, min_periods=1).mean().round(1)
-
-    # Reverse back to original order (most recent first)
-    result = df_reversed.iloc[::-1].reset_index(drop=True)
+            result[col_name] = chronological.rolling(window=window, min_periods=1).mean().round(1)
 
     return result
 
@@ -441,6 +453,44 @@ def detailed_zones(team_shots: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def _shot_points(shots: pd.DataFrame) -> np.ndarray:
+    """Points on each shot: 3 for a made 3PT, 2 for any other make, 0 for a miss."""
+    made = shots['shot_made'].astype(bool).to_numpy()
+    three = (shots['shot_type'] == '3PT').to_numpy()
+    return np.where(made, np.where(three, 3, 2), 0)
+
+
+def _pps_stats(total_shots, total_points, made_shots) -> dict:
+    """PPS stats dict from shot, point, and make totals."""
+    if total_shots == 0:
+        return {'pps': 0.0, 'total_points': 0, 'total_shots': 0, 'fg_pct': 0.0}
+
+    return {
+        'pps': round(total_points / total_shots, 3),
+        'total_points': int(total_points),
+        'total_shots': int(total_shots),
+        'fg_pct': round(made_shots / total_shots * 100, 1)
+    }
+
+
+def _pps_by(shots: pd.DataFrame, keys) -> dict:
+    """
+    PPS stats per group of shots that already carry a 'points' column.
+
+    One grouped reduction instead of a boolean mask per group. Groups come
+    back in first-seen order; rows with a missing key are skipped.
+    """
+    totals = shots.groupby(keys, sort=False).agg(
+        total_shots=('points', 'size'),
+        total_points=('points', 'sum'),
+        made_shots=('shot_made', 'sum'),
+    )
+    return {
+        key: _pps_stats(*row)
+        for key, row in zip(totals.index, totals.itertuples(index=False))
+    }
+
+
 def points_per_shot(
     team_shots: pd.DataFrame,
     by_zone: bool = False,
@@ -486,48 +536,22 @@ def points_per_shot(
         return {}
 
     # Filter out Backcourt shots if requested
-    shots_data = team_shots.copy()
+    shots_data = team_shots
     if exclude_backcourt and 'shot_zone' in shots_data.columns:
         shots_data = shots_data[shots_data['shot_zone'] != 'Backcourt']
 
-    def calc_stats(shots_df: pd.DataFrame) -> dict:
-        """Calculate PPS stats for a group of shots."""
-        total_shots = len(shots_df)
-        if total_shots == 0:
-            return {'pps': 0.0, 'total_points': 0, 'total_shots': 0, 'fg_pct': 0.0}
-
-        # Calculate points: 3 for made 3PT, 2 for made 2PT, 0 for misses
-        points = shots_df.apply(
-            lambda row: 3 if row['shot_made'] and row['shot_type'] == '3PT'
-                       else 2 if row['shot_made'] else 0,
-            axis=1
-        ).sum()
-
-        made_shots = shots_df['shot_made'].sum()
-        fg_pct = (made_shots / total_shots) * 100
-
-        return {
-            'pps': round(points / total_shots, 3),
-            'total_points': int(points),
-            'total_shots': total_shots,
-            'fg_pct': round(fg_pct, 1)
-        }
+    # Points on every shot in one vectorized pass: 3 for made 3PT, 2 for made 2PT, 0 for misses
+    shots_data = shots_data.assign(points=_shot_points(shots_data))
 
     # Calculate overall stats
-    overall = calc_stats(shots_data)
+    overall = _pps_stats(len(shots_data), shots_data['points'].sum(), shots_data['shot_made'].sum())
 
     if not by_zone:
         return overall
 
-    # Calculate per-zone stats
-    zone_stats = {}
-    for zone in shots_data['shot_zone'].dropna().unique():
-        zone_shots = shots_data[shots_data['shot_zone'] == zone]
-        zone_stats[zone] = calc_stats(zone_shots)
-
     return {
         'overall': overall,
-        'by_zone': zone_stats
+        'by_zone': _pps_by(shots_data, 'shot_zone')
     }
 
 
@@ -577,13 +601,7 @@ def zone_leaders(
         team_shots = team_shots[team_shots['shot_zone'] != 'Backcourt']
     
     # Calculate points per shot (2 for 2PT made, 3 for 3PT made, 0 for misses)
-    def calculate_points(row):
-        if row['shot_made']:
-            return 3 if row['shot_type'] == '3PT' else 2
-        return 0
-    
-    team_shots = team_shots.copy()
-    team_shots['points'] = team_shots.apply(calculate_points, axis=1)
+    team_shots = team_shots.assign(points=_shot_points(team_shots))
     
     # Collect stats for every player in every zone (no filtering yet)
     player_zone_stats = []
@@ -850,40 +868,17 @@ def league_pps_by_zone(
     if exclude_backcourt:
         league_shots = league_shots[league_shots['shot_zone'] != 'Backcourt']
 
-    def calc_stats(shots_df: pd.DataFrame) -> dict:
-        """Calculate PPS stats for a group of shots."""
-        total_shots = len(shots_df)
-        if total_shots == 0:
-            return {'pps': 0.0, 'total_points': 0, 'total_shots': 0, 'fg_pct': 0.0}
-
-        points = shots_df.apply(
-            lambda row: 3 if row['shot_made'] and row['shot_type'] == '3PT'
-                       else 2 if row['shot_made'] else 0,
-            axis=1
-        ).sum()
-
-        made_shots = shots_df['shot_made'].sum()
-        fg_pct = (made_shots / total_shots) * 100
-
-        return {
-            'pps': round(points / total_shots, 3),
-            'total_points': int(points),
-            'total_shots': total_shots,
-            'fg_pct': round(fg_pct, 1)
-        }
+    shots = league_shots.assign(points=_shot_points(league_shots))
 
     # Calculate league-wide overall stats
-    league_overall = calc_stats(league_shots)
+    league_overall = _pps_stats(len(shots), shots['points'].sum(), shots['shot_made'].sum())
 
     # Calculate league-wide by zone
-    zone_stats = {}
-    total_league_shots = len(league_shots)
+    zone_stats = _pps_by(shots, 'shot_zone')
+    total_league_shots = len(shots)
 
-    for zone in league_shots['shot_zone'].dropna().unique():
-        zone_shots = league_shots[league_shots['shot_zone'] == zone]
-        stats = calc_stats(zone_shots)
-        stats['pct_of_shots'] = round(len(zone_shots) / total_league_shots * 100, 1)
-        zone_stats[zone] = stats
+    for stats in zone_stats.values():
+        stats['pct_of_shots'] = round(stats['total_shots'] / total_league_shots * 100, 1)
 
     # Rank zones by PPS
     sorted_zones = sorted(zone_stats.items(), key=lambda x: x[1]['pps'], reverse=True)
@@ -892,20 +887,14 @@ def league_pps_by_zone(
 
     # Calculate per-team stats
     team_stats = {}
-    if 'team_abbr' in league_shots.columns:
-        for team_abbr in league_shots['team_abbr'].dropna().unique():
-            team_shots = league_shots[league_shots['team_abbr'] == team_abbr]
-            team_overall = calc_stats(team_shots)
-
-            team_zones = {}
-            for zone in team_shots['shot_zone'].dropna().unique():
-                zone_shots = team_shots[team_shots['shot_zone'] == zone]
-                team_zones[zone] = calc_stats(zone_shots)
-
+    if 'team_abbr' in shots.columns:
+        for team_abbr, team_overall in _pps_by(shots, 'team_abbr').items():
             team_stats[team_abbr] = {
                 'overall': team_overall,
-                'by_zone': team_zones
+                'by_zone': {}
             }
+        for (team_abbr, zone), stats in _pps_by(shots, ['team_abbr', 'shot_zone']).items():
+            team_stats[team_abbr]['by_zone'][zone] = stats
 
     return {
         'league_overall': league_overall,
@@ -914,6 +903,13 @@ def league_pps_by_zone(
     }
 
 
+# 3-point zones, tracked separately in zone usage
+_THREE_POINT_ZONES = ('Right Corner 3', 'Left Corner 3', 'Above the Break 3')
+
+# Default high-value zones: Restricted Area + all 3-point zones
+_HIGH_VALUE_ZONES = ('Restricted Area',) + _THREE_POINT_ZONES
+
+
 def high_value_zone_usage(
     league_shots: pd.DataFrame,
     high_value_zones: Optional[List[str]] = None,
@@ -959,45 +955,37 @@ def high_value_zone_usage(
         return pd.DataFrame()
 
     # Filter out Backcourt shots if requested
-    shots_data = league_shots.copy()
+    shots_data = league_shots
     if exclude_backcourt:
         shots_data = shots_data[shots_data['shot_zone'] != 'Backcourt']
 
-    # Default high-value zones: Restricted Area + all 3-point zones
     if high_value_zones is None:
-        high_value_zones = [
-            'Restricted Area',
-            'Right Corner 3',
-            'Left Corner 3',
-            'Above the Break 3',
-        ]
-
-    # Define 3-point zones for separate tracking
-    three_point_zones = ['Right Corner 3', 'Left Corner 3', 'Above the Break 3']
+        high_value_zones = _HIGH_VALUE_ZONES
+
+    # Count each team's shots by zone class in one grouped pass; teams keep
+    # first-seen order so ties rank exactly as before
+    zones = shots_data['shot_zone']
+    counts = pd.DataFrame({
+        'high_value': zones.isin(high_value_zones),
+        'restricted_area': zones == 'Restricted Area',
+        'three_point': zones.isin(_THREE_POINT_ZONES),
+    }).groupby(shots_data['team_abbr'], sort=False).agg('sum')
+    counts['total_shots'] = shots_data.groupby('team_abbr', sort=False).size()
 
     # Calculate per-team stats
     team_stats = []
-    for team_abbr in shots_data['team_abbr'].dropna().unique():
-        team_shots = shots_data[shots_data['team_abbr'] == team_abbr]
-        total_shots = len(team_shots)
-
-        if total_shots == 0:
-            continue
-
-        # Calculate zone usage percentages
-        high_value_shots = team_shots[team_shots['shot_zone'].isin(high_value_zones)]
-        restricted_area_shots = team_shots[team_shots['shot_zone'] == 'Restricted Area']
-        three_point_shots = team_shots[team_shots['shot_zone'].isin(three_point_zones)]
-
+    for team_abbr, (high_value_shots, restricted_area_shots, three_point_shots, total_shots) in zip(
+        counts.index, counts.to_numpy().tolist()
+    ):
         # Low-value zones: everything not high-value (Mid-Range, In The Paint Non-RA)
-        low_value_shots = team_shots[~team_shots['shot_zone'].isin(high_value_zones)]
+        low_value_shots = total_shots - high_value_shots
 
         team_stats.append({
             'team_abbr': team_abbr,
-            'high_value_pct': round(len(high_value_shots) / total_shots * 100, 1),
-            'restricted_area_pct': round(len(restricted_area_shots) / total_shots * 100, 1),
-            'three_point_pct': round(len(three_point_shots) / total_shots * 100, 1),
-            'low_value_pct': round(len(low_value_shots) / total_shots * 100, 1),
+            'high_value_pct': round(high_value_shots / total_shots * 100, 1),
+            'restricted_area_pct': round(restricted_area_shots / total_shots * 100, 1),
+            'three_point_pct': round(three_point_shots / total_shots * 100, 1),
+            'low_value_pct': round(low_value_shots / total_shots * 100, 1),
             'total_shots': total_shots,
         })
 
@@ -1122,14 +1110,16 @@ def game_zone_stats(shots_data: pd.DataFrame) -> Dict[str, Dict]:
 
     result = {}
 
-    for zone in shots_data['shot_zone'].dropna().unique():
-        zone_shots = shots_data[shots_data['shot_zone'] == zone]
-        attempted = len(zone_shots)
-        made = zone_shots['shot_made'].sum()
+    # One grouped pass instead of a boolean mask per zone; first-seen zone order
+    by_zone = shots_data.groupby('shot_zone', sort=False)['shot_made'].agg(['sum', 'size'])
+
+    for zone, made, attempted in zip(by_zone.index, by_zone['sum'], by_zone['size']):
+        made = int(made)
+        attempted = int(attempted)
         pct = (made / attempted * 100) if attempted > 0 else 0.0
 
         result[zone] = {
-            'made': int(made),
+            'made': made,
             'attempted': attempted,
             'pct': round(pct, 1),
             'formatted': f"{made}/{attempted} ({pct:.1f}%)"
@@ -838,8 +838,6 @@ def get_player_headshot(
         Path to cached headshot PNG, or None if download fails.
     """
     cache_path = Path(cache_dir)
-    cache_path.mkdir(parents=True, exist_ok=True)
-
     file_path = cache_path / f"{player_id}.png"
     if file_path.exists():
         return file_path
@@ -848,6 +846,7 @@ def get_player_headshot(
     try:
         resp = requests.get(url, timeout=10)
         resp.raise_for_status()
+        cache_path.mkdir(parents=True, exist_ok=True)
         file_path.write_bytes(resp.content)
         return file_path
     except requests.RequestException:
@@ -8,7 +8,7 @@ origin, court 500 units wide, baseline at y=-47.5.
 """
 from __future__ import annotations
 
-from matplotlib.patches import Arc, Circle, FancyBboxPatch
+import numpy as np
 
 
 # Court constants, tenths of a foot.
@@ -22,6 +22,24 @@ COURT_HALF_WIDTH = 250.0
 # Warm court line for pale panels; the Summer League report's original value.
 COURT_LINE = "#C9A8B5"
 
+THREE_THETA = 22.1  # angle where the arc meets the corner lines
+
+
+def _unit_arc(theta1: float, theta2: float, steps: int = 64):
+    t = np.radians(np.linspace(theta1, theta2, steps))
+    return np.cos(t), np.sin(t)
+
+
+# Arcs are plotted as polylines scaled from these unit curves, so a court costs
+# two Line2D artists instead of rebuilding Arc/Circle patches (and their Bezier
+# approximations) on every draw.
+_FULL_CIRCLE = _unit_arc(0.0, 360.0)
+_UPPER_HALF = _unit_arc(0.0, 180.0)
+_LOWER_HALF = _unit_arc(180.0, 360.0)
+_THREE_ARC = _unit_arc(THREE_THETA, 180.0 - THREE_THETA)
+_BREAK = np.full((1, 2), np.nan)
+
+
 def draw_half_court(ax, center_x: float, center_y: float, s: float,
                     color: str = COURT_LINE, lw: float = 1.1, zorder: int = 5):
     """Draw a half court centred at (center_x, center_y), hoop toward the bottom.
@@ -40,36 +58,37 @@ def draw_half_court(ax, center_x: float, center_y: float, s: float,
     def t(cx, cy):
         return x0 + (cx + COURT_HALF_WIDTH) * s, y0 + (cy - BASELINE_Y) * s
 
-    line = dict(color=color, lw=lw, zorder=zorder)
-    ax.plot([t(-250, BASELINE_Y)[0], t(250, BASELINE_Y)[0]], [y0, y0], **line)
-    for side in (-250, 250):
-        ax.plot([t(side, BASELINE_Y)[0]] * 2,
-                [t(side, BASELINE_Y)[1], t(side, 110)[1]], **line)
-    ax.add_patch(FancyBboxPatch(
-        t(-PAINT_HALF_WIDTH, BASELINE_Y), 2 * PAINT_HALF_WIDTH * s, 190 * s,
-        boxstyle="square,pad=0", facecolor="none", edgecolor=color,
-        lw=lw, zorder=zorder))
+    def arc(cx, cy, r, unit):
+        return np.column_stack((cx + r * unit[0], cy + r * unit[1]))
 
     hoop_x, hoop_y = t(0, 0)
-    ax.add_patch(Circle((hoop_x, hoop_y), 7.5 * s * 2, facecolor="none",
-                        edgecolor=color, lw=lw, zorder=zorder))
-    # Backboard: 6 ft wide, 1 ft behind the rim.
-    ax.plot([t(-30, -7.5)[0], t(30, -7.5)[0]], [t(0, -7.5)[1]] * 2, **line)
-    # Restricted-area arc.
-    ax.add_patch(Arc((hoop_x, hoop_y), 2 * 40 * s, 2 * 40 * s, theta1=0,
-                     theta2=180, color=color, lw=lw, zorder=zorder))
-    # Free-throw circle: solid above the line, dashed below.
     ft_x, ft_y = t(0, FT_LINE_Y)
-    ax.add_patch(Arc((ft_x, ft_y), 2 * 60 * s, 2 * 60 * s, theta1=0, theta2=180,
-                     color=color, lw=lw, zorder=zorder))
-    ax.add_patch(Arc((ft_x, ft_y), 2 * 60 * s, 2 * 60 * s, theta1=180, theta2=360,
-                     color=color, lw=lw, linestyle=(0, (4, 3)), zorder=zorder))
-    # Three-point line: straight corner runs, then the arc between them.
     corner_top = (ARC ** 2 - CORNER_X ** 2) ** 0.5
-    for side in (-CORNER_X, CORNER_X):
-        ax.plot([t(side, BASELINE_Y)[0]] * 2,
-                [t(side, BASELINE_Y)[1], t(side, corner_top)[1]], **line)
-    theta = 22.1  # angle where the arc meets the corner lines
-    ax.add_patch(Arc((hoop_x, hoop_y), 2 * ARC * s, 2 * ARC * s, theta1=theta,
-                     theta2=180 - theta, color=color, lw=lw, zorder=zorder))
+    paint_left, paint_right = -PAINT_HALF_WIDTH, PAINT_HALF_WIDTH
+    solid = [
+        # Baseline and the stub of each sideline.
+        [t(-250, BASELINE_Y), t(250, BASELINE_Y)],
+        [t(-250, BASELINE_Y), t(-250, 110)],
+        [t(250, BASELINE_Y), t(250, 110)],
+        # Paint, up to the free-throw line.
+        [t(paint_left, BASELINE_Y), t(paint_left, FT_LINE_Y), t(paint_right, FT_LINE_Y),
+         t(paint_right, BASELINE_Y), t(paint_left, BASELINE_Y)],
+        # Rim, and the backboard 6 ft wide, 1 ft behind it.
+        arc(hoop_x, hoop_y, 7.5 * s * 2, _FULL_CIRCLE),
+        [t(-30, -7.5), t(30, -7.5)],
+        # Restricted-area arc; free-throw circle, solid above the line.
+        arc(hoop_x, hoop_y, 40 * s, _UPPER_HALF),
+        arc(ft_x, ft_y, 60 * s, _UPPER_HALF),
+        # Three-point line: straight corner runs, then the arc between them.
+        [t(-CORNER_X, BASELINE_Y), t(-CORNER_X, corner_top)],
+        [t(CORNER_X, BASELINE_Y), t(CORNER_X, corner_top)],
+        arc(hoop_x, hoop_y, ARC * s, _THREE_ARC),
+    ]
+    # Every solid marking is one Line2D: the pieces are joined with NaN breaks.
+    xy = np.concatenate([np.vstack([np.asarray(piece, dtype=float), _BREAK])
+                         for piece in solid])
+    line = dict(color=color, lw=lw, zorder=zorder)
+    ax.plot(xy[:, 0], xy[:, 1], **line)
+    # Free-throw circle below the line is dashed, so it gets its own artist.
+    ax.plot(*arc(ft_x, ft_y, 60 * s, _LOWER_HALF).T, linestyle=(0, (4, 3)), **line)
     return x0, y0
@@ -8,6 +8,7 @@ paths (resolve player ids via bulls.data.fetch.get_player_headshot).
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -164,6 +165,20 @@ def threshold_footer(
     )
 
 
+@lru_cache(maxsize=8)
+def _disc_distance_sq(size: int) -> np.ndarray:
+    """Squared pixel distance from the centre of a size x size square.
+
+    Every headshot crops to the same square, so the grid is built once per
+    size and shared (read-only) by the circle and ring masks.
+    """
+    Y, X = np.ogrid[:size, :size]
+    center = size // 2
+    dist_sq = (X - center) ** 2 + (Y - center) ** 2
+    dist_sq.flags.writeable = False
+    return dist_sq
+
+
 def _make_circular_headshot(
     img_path: Path,
     border_color: Optional[tuple] = None,
@@ -181,9 +196,9 @@ def _make_circular_headshot(
     img = img[:sq, x_start:x_start + sq]
 
     h, w = img.shape[:2]
-    Y, X = np.ogrid[:h, :w]
+    dist_sq = _disc_distance_sq(h)
     center = h // 2
-    outer_mask = ((X - center) ** 2 + (Y - center) ** 2) <= center ** 2
+    outer_mask = dist_sq <= center ** 2
 
     # Ensure RGBA
     if img.shape[2] == 3:
@@ -197,7 +212,7 @@ def _make_circular_headshot(
     if border_color is not None:
         border_px = max(int(center * border_frac), 2)
         inner_radius = center - border_px
-        inner_mask = ((X - center) ** 2 + (Y - center) ** 2) <= inner_radius ** 2
+        inner_mask = dist_sq <= inner_radius ** 2
         ring = outer_mask & ~inner_mask
         if img.dtype == np.uint8:
             img[ring] = [int(c) for c in border_color[:3]] + [255]
@@ -215,9 +230,8 @@ def _make_circular_headshot(
 
 def _placeholder_disc(size: int = _PLACEHOLDER_PX) -> np.ndarray:
     """RGBA disc (light gray fill, muted ring) for missing headshots."""
-    Y, X = np.ogrid[:size, :size]
     center = size // 2
-    dist_sq = (X - center) ** 2 + (Y - center) ** 2
+    dist_sq = _disc_distance_sq(size)
     outer = dist_sq <= center ** 2
     ring_px = max(int(center * 0.06), 2)
     ring = outer & (dist_sq >= (center - ring_px) ** 2)
@@ -12,6 +12,7 @@ that the visual grammar repeats.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Sequence
 
@@ -204,7 +205,15 @@ def helvetica(weight: str = "regular") -> fm.FontProperties:
     instead. Extraction stays in ``cache/`` so the licensed system font is never
     copied into the repository. Falls back to an installed sans-serif when
     Helvetica is unavailable (non-macOS).
+
+    Faces are resolved once per weight; each call gets its own copy, so a
+    caller that resizes or restyles its FontProperties can't leak into others.
     """
+    return _helvetica_face(weight).copy()
+
+
+@lru_cache(maxsize=None)
+def _helvetica_face(weight: str) -> fm.FontProperties:
     if not _HELVETICA_TTC.exists():
         return fm.FontProperties(family=["Helvetica", "Arial", "DejaVu Sans"], weight=weight)
     extracted = _FONT_CACHE_DIR / f"Helvetica-{weight}.ttf"
@@ -30,9 +30,14 @@ import argparse
 import sys
 from pathlib import Path
 
+import matplotlib
+
+matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from matplotlib.collections import PatchCollection
 from matplotlib.colors import LinearSegmentedColormap, Normalize
 from matplotlib.patches import FancyBboxPatch, Rectangle, RegularPolygon, Wedge
 
@@ -129,8 +134,6 @@ GRIDSIZE, MIN_ATT, SMOOTH_R, MIN_SMOOTH, DIFF_CLAMP = 18, 2, 45.0, 20, 0.10
 
 
 def render_hex(ctx, out: Path, final: bool):
-    from scipy.spatial import cKDTree
-
     theme = house.get_theme("jersey")
     fig, ax = house.new_canvas(theme)
     s = 1.72
@@ -142,10 +145,8 @@ def render_hex(ctx, out: Path, final: bool):
 
     # Efficiency is pooled from a neighbourhood: a hex holding three shots can
     # only score 0/33/67/100%, which is noise dressed as signal.
-    p_fg, pool = _pooled(cKDTree(np.c_[p.loc_x, p.loc_y]),
-                         p.shot_made.to_numpy(float), centres)
-    l_fg, _ = _pooled(cKDTree(np.c_[l.loc_x, l.loc_y]),
-                      l.shot_made.to_numpy(float), centres)
+    p_fg, pool = _pooled(p, centres)
+    l_fg, _ = _pooled(l, centres)
     df = pd.DataFrame({"x": centres[:, 0], "y": centres[:, 1], "att": att,
                        "pool": pool, "diff": p_fg - l_fg})
     df = df[df.att >= MIN_ATT].copy()
@@ -154,13 +155,14 @@ def render_hex(ctx, out: Path, final: bool):
     hex_r = (sm.GRID_X[1] - sm.GRID_X[0]) / GRIDSIZE / np.sqrt(3) * 1.08
     cap = float(np.percentile(df.att, 92))
     norm = Normalize(-DIFF_CLAMP, DIFF_CLAMP)
-    for row in df.itertuples():
-        r = hex_r * s * (0.34 + 0.66 * min(row.att / cap, 1.0) ** 0.5)
-        color = "#D8D2CA" if np.isnan(row.diff) else HEX_CMAP(norm(row.diff))
-        ax.add_patch(RegularPolygon(
-            (x0 + (row.x + 250.0) * s, y0 + (row.y + 47.5) * s), numVertices=6,
-            radius=r, orientation=0, facecolor=color, edgecolor=theme.canvas,
-            linewidth=0.5, zorder=3))
+    radii = hex_r * s * (0.34 + 0.66 * np.minimum(df.att / cap, 1.0) ** 0.5)
+    px, py = x0 + (df.x + 250.0) * s, y0 + (df.y + 47.5) * s
+    # One collection for every hex: a single artist to draw, colors mapped in one call.
+    ax.add_collection(PatchCollection(
+        [RegularPolygon(xy, numVertices=6, radius=r, orientation=0)
+         for xy, r in zip(zip(px, py), radii)],
+        facecolors=HEX_CMAP.with_extremes(bad="#D8D2CA")(norm(df["diff"].to_numpy())),
+        edgecolors=theme.canvas, linewidths=0.5, zorder=3))
 
     _header(ax, theme, ctx, "Size = shot frequency  ·  Color = FG% vs. league from that spot")
     made = ctx["player"].shot_made.sum()
@@ -177,23 +179,37 @@ def render_hex(ctx, out: Path, final: bool):
     _save(fig, out, final, theme.canvas)
 
 
-def _hexbin(x, y, c=None):
+def _hexbin(x, y):
+    """Hex centres and attempt counts on the shared grid.
+
+    Count-only on purpose: hexbin bins counts in one vectorized pass, while a C
+    array runs reduce_C_function once per hex in Python. Makes are pooled by
+    _pooled instead.
+    """
     fig = plt.figure()
     ax = fig.add_subplot(111)
-    kw = dict(gridsize=GRIDSIZE, extent=(*sm.GRID_X, *sm.GRID_Y), mincnt=0)
-    hb = ax.hexbin(x, y, C=c, reduce_C_function=np.sum, **kw) if c is not None \
-        else ax.hexbin(x, y, **kw)
+    hb = ax.hexbin(x, y, gridsize=GRIDSIZE, extent=(*sm.GRID_X, *sm.GRID_Y), mincnt=0)
     centres, values = hb.get_offsets(), np.asarray(hb.get_array(), dtype=float)
     plt.close(fig)
     return centres, values
 
 
-def _pooled(tree, made, centres, radius=SMOOTH_R):
-    att = np.zeros(len(centres))
-    hit = np.zeros(len(centres))
-    for i, idx in enumerate(tree.query_ball_point(centres, radius)):
-        att[i] = len(idx)
-        hit[i] = made[idx].sum() if idx else 0.0
+def _in_radius(xy, centres, radius):
+    """Shots within ``radius`` of each centre, counted inside the kd-tree."""
+    from scipy.spatial import cKDTree
+
+    if not len(xy):
+        return np.zeros(len(centres))
+    return cKDTree(xy).query_ball_point(centres, radius, return_length=True).astype(float)
+
+
+def _pooled(shots, centres, radius=SMOOTH_R):
+    # Makes are counted on a tree of made shots rather than by summing each
+    # neighbour list in Python; the league pool runs to hundreds of thousands.
+    xy = np.c_[shots.loc_x, shots.loc_y]
+    made = shots.shot_made.to_numpy(bool)
+    att = _in_radius(xy, centres, radius)
+    hit = _in_radius(xy[made], centres, radius)
     with np.errstate(invalid="ignore", divide="ignore"):
         return np.where(att > 0, hit / att, np.nan), att
 
@@ -300,10 +316,7 @@ def render_rings(ctx, out: Path, final: bool):
 
     _scale_legend(ax)
 
-    out.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(out, dpi=house.export_dpi(final), transparent=True)
-    plt.close(fig)
-    print(f"Saved {out}")
+    _save(fig, out, final)
 
 
 def _band(ax, centre, r_in, r_out, s, color, clip):
@@ -465,10 +478,7 @@ def render_cells(ctx, out: Path, final: bool):
             ha="center", va="center", fontsize=10, color=LEGEND_INK, alpha=0.9,
             zorder=9, fontproperties=helvetica("bold"))
 
-    out.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(out, dpi=house.export_dpi(final), transparent=True)
-    plt.close(fig)
-    print(f"Saved {out}")
+    _save(fig, out, final)
 
 
 def _cell_angles(cell) -> tuple[float, float]:
@@ -578,6 +588,7 @@ def _cell_label(ax, hx, hy, cell, s):
 LADDER_CMAP = LinearSegmentedColormap.from_list("ladder", [
     "#5E1119", "#8C1D22", "#C0392B", "#E2614A", "#F0A05F", "#EFD07A",
     "#BFD16C", "#7FBF5E", "#4C9B4A", "#2E7D3A", "#1B5E2A"])
+LADDER_RAMP = np.linspace(0, 1, 512).reshape(1, -1)   # legend bar image, built once
 LADDER_SEAM = "#00000022"     # a hairline between rings, dark and nearly invisible
 LADDER_INK, LADDER_INK_DARK = "#FFFFFF", "#2A2118"
 # Light, so the run of unrated rings recedes into "nothing happens here" rather
@@ -759,10 +770,7 @@ def render_ladder(ctx, out: Path, final: bool):
                 f"TOO FEW TO RATE ({grey} BANDS)")
     _fit_note(ax, 90, key)
 
-    out.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(out, dpi=house.export_dpi(final), transparent=True)
-    plt.close(fig)
-    print(f"Saved {out}")
+    _save(fig, out, final)
 
 
 RING_STEPS = 6          # sub-bands per ring, for the inner-edge lift
@@ -968,8 +976,7 @@ def _ladder_legend(ax, norm, metric, ticks):
     """
     w, h, y = 760.0, 22.0, 176.0
     x0 = (house.CANVAS_WIDTH - w) / 2
-    grad = np.linspace(0, 1, 512).reshape(1, -1)
-    ax.imshow(grad, extent=(x0, x0 + w, y, y + h), aspect="auto",
+    ax.imshow(LADDER_RAMP, extent=(x0, x0 + w, y, y + h), aspect="auto",
               cmap=LADDER_CMAP, zorder=9)
     ax.text(house.CANVAS_WIDTH / 2, y + h + 26, metric["title"], ha="center",
             va="center", fontsize=11, color=LEGEND_INK, zorder=9,
@@ -1020,9 +1027,13 @@ def _footer(ax, theme, ctx):
             fontsize=9, color=theme.faint, fontproperties=helvetica())
 
 
-def _save(fig, out: Path, final: bool, facecolor: str):
+def _save(fig, out: Path, final: bool, facecolor: str | None = None):
+    """Write the chart and close it; no facecolor means a transparent asset."""
     out.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(out, dpi=house.export_dpi(final), facecolor=facecolor)
+    if facecolor is None:
+        fig.savefig(out, dpi=house.export_dpi(final), transparent=True)
+    else:
+        fig.savefig(out, dpi=house.export_dpi(final), facecolor=facecolor)
     plt.close(fig)
     print(f"Saved {out}")
 
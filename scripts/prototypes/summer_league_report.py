@@ -19,6 +19,7 @@ Example:
 import argparse
 import sys
 from collections import Counter
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
@@ -34,6 +35,7 @@ import matplotlib.colors as mcolors
 import matplotlib.patheffects as pe
 import matplotlib.pyplot as plt
 import pandas as pd
+from matplotlib.collections import PatchCollection
 from matplotlib.patches import Arc, Circle, FancyBboxPatch
 from nba_api.stats.endpoints import (
     boxscoreadvancedv3,
@@ -297,7 +299,7 @@ def team_nickname(tricode: str) -> str:
     return full_name.rsplit(" ", 1)[-1]
 
 
-def corrected_zone(shot: pd.Series) -> str:
+def corrected_zone(shot: Mapping) -> str:
     """The NBA zone label, fixed when it contradicts the shot's own 2PT/3PT type.
 
     Boundary shots occasionally carry the wrong zone (a made three at x=219
@@ -327,7 +329,7 @@ def shot_diet(shots: pd.DataFrame, player_id: int | None) -> Counter:
     """
     buckets = Counter({"rim": 0, "paint": 0, "mid": 0, "three": 0})
     rows = shots if player_id is None else shots[shots["player_id"] == player_id]
-    for _, shot in rows.iterrows():
+    for shot in rows.to_dict("records"):
         buckets[SHOT_ZONE_BUCKETS.get(corrected_zone(shot), "three")] += 1
     return buckets
 
@@ -344,7 +346,7 @@ def zone_splits(shots: pd.DataFrame, player_id: int | None) -> dict[str, tuple[i
     """Makes and attempts per shot-zone group, from the NBA's own zone labels."""
     rows = shots if player_id is None else shots[shots["player_id"] == player_id]
     splits = {"rim_paint": [0, 0], "mid": [0, 0], "three": [0, 0]}
-    for _, shot in rows.iterrows():
+    for shot in rows.to_dict("records"):
         bucket = SHOT_ZONE_BUCKETS.get(corrected_zone(shot), "three")
         key = "rim_paint" if bucket in ("rim", "paint") else ("mid" if bucket == "mid" else "three")
         splits[key][1] += 1
@@ -530,7 +532,9 @@ def prepare_team_zones(shots: pd.DataFrame) -> tuple[ZoneItem, ...]:
         ("above_break", "Above the Break 3"),
     )
     total_attempts = len(shots)
-    labels = shots.apply(corrected_zone, axis=1) if total_attempts else pd.Series(dtype=object)
+    labels = pd.Series(
+        [corrected_zone(shot) for shot in shots.to_dict("records")], index=shots.index, dtype=object
+    )
     results = []
     for key, nba_label in zone_keys:
         if key == "above_break":
@@ -556,8 +560,8 @@ def prepare_shot_marks(shots: pd.DataFrame, player_id: int | None) -> tuple[Shot
     """Remove dataframe/API vocabulary before shot attempts reach drawing code."""
     rows = shots if player_id is None else shots[shots["player_id"] == player_id]
     return tuple(
-        ShotMark(float(shot["loc_x"]), float(shot["loc_y"]), bool(shot["shot_made"]))
-        for _, shot in rows.iterrows()
+        ShotMark(float(x), float(y), bool(made))
+        for x, y, made in zip(rows["loc_x"], rows["loc_y"], rows["shot_made"])
     )
 
 
@@ -702,15 +706,20 @@ def _draw_shot_map(
 
     dot_r = max(5.0, 5 * s / 0.42 * 0.7)
     legend_size = 8 if s <= 0.6 else 12
-    for shot in attempts:
-        cx, cy = shot.x, min(shot.y, top_y)
-        dot_x, dot_y = t(cx, cy)
-        if shot.made:
-            ax.add_patch(Circle((dot_x, dot_y), dot_r, facecolor=RED, edgecolor="#FFFFFF", lw=0.8, zorder=4))
-        elif miss_as_x:
-            ax.plot(dot_x, dot_y, marker="x", ms=dot_r * 0.72, color=INK, mew=1.2, zorder=4)
-        else:
-            ax.add_patch(Circle((dot_x, dot_y), dot_r, facecolor="#FFFFFF", edgecolor=MUTED, lw=1.2, zorder=4))
+    # One artist per mark style rather than one per shot; makes draw over misses.
+    made = [t(shot.x, min(shot.y, top_y)) for shot in attempts if shot.made]
+    missed = [t(shot.x, min(shot.y, top_y)) for shot in attempts if not shot.made]
+    if missed and miss_as_x:
+        xs, ys = zip(*missed)
+        ax.plot(xs, ys, linestyle="none", marker="x", ms=dot_r * 0.72, color=INK, mew=1.2, zorder=4)
+    elif missed:
+        ax.add_collection(PatchCollection(
+            [Circle(xy, dot_r) for xy in missed], facecolor="#FFFFFF", edgecolor=MUTED, lw=1.2, zorder=4
+        ))
+    if made:
+        ax.add_collection(PatchCollection(
+            [Circle(xy, dot_r) for xy in made], facecolor=RED, edgecolor="#FFFFFF", lw=0.8, zorder=4
+        ))
     if not draw_legend:
         return
     legend_y = y0 - (14 if s <= 0.6 else 26)
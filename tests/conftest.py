@@ -7,44 +7,18 @@ from bulls.config import BULLS_TEAM_ID
 
 
 # Sample game data matching NBA API response format
-MOCK_GAMES_DATA = pd.DataFrame([
-    {
-        'GAME_ID': '0022500503',
-        'GAME_DATE': '2026-01-10',
-        'MATCHUP': 'CHI vs. MIA',
-        'WL': 'W',
-        'PTS': 112,
-        'PLUS_MINUS': 8,
-        'MIN': 240,
-        'FGM': 42,
-        'FGA': 88,
-        'FG_PCT': 0.477,
-    },
-    {
-        'GAME_ID': '0022500489',
-        'GAME_DATE': '2026-01-08',
-        'MATCHUP': 'CHI @ BOS',
-        'WL': 'L',
-        'PTS': 98,
-        'PLUS_MINUS': -12,
-        'MIN': 240,
-        'FGM': 36,
-        'FGA': 85,
-        'FG_PCT': 0.424,
-    },
-    {
-        'GAME_ID': '0022500475',
-        'GAME_DATE': '2026-01-06',
-        'MATCHUP': 'CHI vs. NYK',
-        'WL': 'W',
-        'PTS': 105,
-        'PLUS_MINUS': 3,
-        'MIN': 240,
-        'FGM': 40,
-        'FGA': 90,
-        'FG_PCT': 0.444,
-    },
-])
+MOCK_GAMES_DATA = pd.DataFrame({
+    'GAME_ID': ['0022500503', '0022500489', '0022500475'],
+    'GAME_DATE': ['2026-01-10', '2026-01-08', '2026-01-06'],
+    'MATCHUP': ['CHI vs. MIA', 'CHI @ BOS', 'CHI vs. NYK'],
+    'WL': ['W', 'L', 'W'],
+    'PTS': [112, 98, 105],
+    'PLUS_MINUS': [8, -12, 3],
+    'MIN': [240, 240, 240],
+    'FGM': [42, 36, 40],
+    'FGA': [88, 85, 90],
+    'FG_PCT': [0.477, 0.424, 0.444],
+})
 
 
 @pytest.fixture
@@ -68,85 +42,36 @@ def mock_empty_api():
 
 
 # Sample box score data matching NBA API response format
-MOCK_BOX_SCORE_DATA = pd.DataFrame([
-    {
-        'teamId': BULLS_TEAM_ID,
-        'firstName': 'Coby',
-        'familyName': 'White',
-        'points': 22,
-        'reboundsTotal': 4,
-        'assists': 5,
-        'steals': 1,
-        'blocks': 0,
-        'fieldGoalsMade': 8,
-        'fieldGoalsAttempted': 16,
-        'threePointersMade': 3,
-        'threePointersAttempted': 7,
-        'freeThrowsMade': 3,
-        'freeThrowsAttempted': 4,
-        'turnovers': 2,
-        'minutes': '32:15',
-    },
-    {
-        'teamId': BULLS_TEAM_ID,
-        'firstName': 'Zach',
-        'familyName': 'LaVine',
-        'points': 28,
-        'reboundsTotal': 6,
-        'assists': 4,
-        'steals': 2,
-        'blocks': 1,
-        'fieldGoalsMade': 10,
-        'fieldGoalsAttempted': 20,
-        'threePointersMade': 4,
-        'threePointersAttempted': 9,
-        'freeThrowsMade': 4,
-        'freeThrowsAttempted': 5,
-        'turnovers': 3,
-        'minutes': '35:42',
-    },
-])
+MOCK_BOX_SCORE_DATA = pd.DataFrame({
+    'teamId': [BULLS_TEAM_ID, BULLS_TEAM_ID],
+    'firstName': ['Coby', 'Zach'],
+    'familyName': ['White', 'LaVine'],
+    'points': [22, 28],
+    'reboundsTotal': [4, 6],
+    'assists': [5, 4],
+    'steals': [1, 2],
+    'blocks': [0, 1],
+    'fieldGoalsMade': [8, 10],
+    'fieldGoalsAttempted': [16, 20],
+    'threePointersMade': [3, 4],
+    'threePointersAttempted': [7, 9],
+    'freeThrowsMade': [3, 4],
+    'freeThrowsAttempted': [4, 5],
+    'turnovers': [2, 3],
+    'minutes': ['32:15', '35:42'],
+})
 
 
 # Sample shot chart data
-MOCK_SHOT_CHART_DATA = pd.DataFrame([
-    {
-        'LOC_X': 0,
-        'LOC_Y': 50,
-        'SHOT_MADE_FLAG': 1,
-        'SHOT_TYPE': '2PT Field Goal',
-        'SHOT_ZONE_BASIC': 'Restricted Area',
-        'SHOT_DISTANCE': 2,
-        'GAME_ID': '0022500503',
-    },
-    {
-        'LOC_X': 150,
-        'LOC_Y': 200,
-        'SHOT_MADE_FLAG': 0,
-        'SHOT_TYPE': '3PT Field Goal',
-        'SHOT_ZONE_BASIC': 'Right Corner 3',
-        'SHOT_DISTANCE': 24,
-        'GAME_ID': '0022500503',
-    },
-    {
-        'LOC_X': -100,
-        'LOC_Y': 100,
-        'SHOT_MADE_FLAG': 1,
-        'SHOT_TYPE': '2PT Field Goal',
-        'SHOT_ZONE_BASIC': 'Mid-Range',
-        'SHOT_DISTANCE': 12,
-        'GAME_ID': '0022500489',
-    },
-    {
-        'LOC_X': 0,
-        'LOC_Y': 250,
-        'SHOT_MADE_FLAG': 1,
-        'SHOT_TYPE': '3PT Field Goal',
-        'SHOT_ZONE_BASIC': 'Above the Break 3',
-        'SHOT_DISTANCE': 26,
-        'GAME_ID': '0022500489',
-    },
-])
+MOCK_SHOT_CHART_DATA = pd.DataFrame({
+    'LOC_X': [0, 150, -100, 0],
+    'LOC_Y': [50, 200, 100, 250],
+    'SHOT_MADE_FLAG': [1, 0, 1, 1],
+    'SHOT_TYPE': ['2PT Field Goal', '3PT Field Goal', '2PT Field Goal', '3PT Field Goal'],
+    'SHOT_ZONE_BASIC': ['Restricted Area', 'Right Corner 3', 'Mid-Range', 'Above the Break 3'],
+    'SHOT_DISTANCE': [2, 24, 12, 26],
+    'GAME_ID': ['0022500503', '0022500503', '0022500489', '0022500489'],
+})
 
 
 @pytest.fixture
@@ -190,9 +115,13 @@ def mock_empty_shot_chart_api():
         yield mock_shot
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_player_games():
-    """Sample player games DataFrame for analysis tests."""
+    """Sample player games DataFrame for analysis tests.
+
+    Module-scoped: the analysis functions copy before adding columns, so one
+    frame is shared by every test in a file.
+    """
     return pd.DataFrame({
         'game_id': ['001', '002', '003', '004', '005'],
         'date': ['2026-01-10', '2026-01-08', '2026-01-06', '2026-01-04', '2026-01-02'],
@@ -216,6 +145,24 @@ def sample_player_games():
     })
 
 
+@pytest.fixture(scope="module")
+def sample_box_score():
+    """Sample three-player box score DataFrame for top_performers tests."""
+    return pd.DataFrame({
+        'personId': [1, 2, 3],
+        'name': ['Player A', 'Player B', 'Player C'],
+        'firstName': ['Player', 'Player', 'Player'],
+        'familyName': ['A', 'B', 'C'],
+        'points': [20, 15, 10],
+        'reboundsTotal': [5, 6, 7],
+        'assists': [3, 4, 5],
+        'steals': [1, 2, 1],
+        'blocks': [0, 1, 0],
+        'fieldGoalsMade': [8, 6, 4],
+        'fieldGoalsAttempted': [15, 12, 10],
+    })
+
+
 @pytest.fixture
 def mock_roster_efficiency_data():
     """Sample roster efficiency data for efficiency_matrix tests."""
@@ -228,87 +175,19 @@ def mock_roster_efficiency_data():
     ]
 
 
-# Extended mock box score data with player IDs for roster efficiency
-MOCK_BOX_SCORE_WITH_IDS = pd.DataFrame([
-    {
-        'teamId': BULLS_TEAM_ID,
-        'personId': 1629632,
-        'playerId': 1629632,
-        'firstName': 'Coby',
-        'familyName': 'White',
-        'points': 22,
-        'reboundsTotal': 4,
-        'assists': 5,
-        'steals': 1,
-        'blocks': 0,
-        'fieldGoalsMade': 8,
-        'fieldGoalsAttempted': 16,
-        'threePointersMade': 3,
-        'threePointersAttempted': 7,
-        'freeThrowsMade': 3,
-        'freeThrowsAttempted': 4,
-        'turnovers': 2,
-        'minutes': '32:15',
-    },
-    {
-        'teamId': BULLS_TEAM_ID,
-        'personId': 1630224,
-        'playerId': 1630224,
-        'firstName': 'Zach',
-        'familyName': 'LaVine',
-        'points': 28,
-        'reboundsTotal': 6,
-        'assists': 4,
-        'steals': 2,
-        'blocks': 1,
-        'fieldGoalsMade': 10,
-        'fieldGoalsAttempted': 20,
-        'threePointersMade': 4,
-        'threePointersAttempted': 9,
-        'freeThrowsMade': 4,
-        'freeThrowsAttempted': 5,
-        'turnovers': 3,
-        'minutes': '35:42',
-    },
-])
-
-
-# Extended team shot data with player info
-MOCK_TEAM_SHOTS_DATA = pd.DataFrame([
-    {
-        'LOC_X': 0,
-        'LOC_Y': 50,
-        'SHOT_MADE_FLAG': 1,
-        'SHOT_TYPE': '2PT Field Goal',
-        'SHOT_ZONE_BASIC': 'Restricted Area',
-        'SHOT_DISTANCE': 2,
-        'GAME_ID': '0022500503',
-        'PLAYER_ID': 1629632,
-        'PLAYER_NAME': 'Coby White',
-    },
-    {
-        'LOC_X': 150,
-        'LOC_Y': 200,
-        'SHOT_MADE_FLAG': 0,
-        'SHOT_TYPE': '3PT Field Goal',
-        'SHOT_ZONE_BASIC': 'Right Corner 3',
-        'SHOT_DISTANCE': 24,
-        'GAME_ID': '0022500503',
-        'PLAYER_ID': 1630224,
-        'PLAYER_NAME': 'Zach LaVine',
-    },
-    {
-        'LOC_X': -100,
-        'LOC_Y': 100,
-        'SHOT_MADE_FLAG': 1,
-        'SHOT_TYPE': '2PT Field Goal',
-        'SHOT_ZONE_BASIC': 'Mid-Range',
-        'SHOT_DISTANCE': 12,
-        'GAME_ID': '0022500489',
-        'PLAYER_ID': 1629632,
-        'PLAYER_NAME': 'Coby White',
-    },
-])
+# Extended mock box score data with player IDs for roster efficiency:
+# the same two box-score lines, plus the ids get_roster_efficiency keys on
+MOCK_BOX_SCORE_WITH_IDS = MOCK_BOX_SCORE_DATA.copy()
+MOCK_BOX_SCORE_WITH_IDS.insert(1, 'personId', [1629632, 1630224])
+MOCK_BOX_SCORE_WITH_IDS.insert(2, 'playerId', MOCK_BOX_SCORE_WITH_IDS['personId'])
+
+
+# Extended team shot data with player info: the first three mock shots,
+# attributed to the players in the box score above
+MOCK_TEAM_SHOTS_DATA = MOCK_SHOT_CHART_DATA.iloc[:3].assign(
+    PLAYER_ID=[1629632, 1630224, 1629632],
+    PLAYER_NAME=['Coby White', 'Zach LaVine', 'Coby White'],
+)
 
 
 @pytest.fixture
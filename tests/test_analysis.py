@@ -1,5 +1,6 @@
 """Tests for bulls.analysis module."""
 import pytest
+import numpy as np
 import pandas as pd
 from bulls.analysis import (
     season_averages,
@@ -15,8 +16,17 @@ from bulls.analysis import (
     points_per_shot,
     high_value_zone_usage,
     zone_volume_leaders,
+    game_zone_stats,
 )
 
+# Shared by the empty-input tests; the analysis functions only read it.
+_EMPTY_DF = pd.DataFrame()
+
+
+def _by_team(result):
+    """Index a zone-usage result by team for scalar ``.at`` lookups."""
+    return result.set_index('team_abbr')
+
 
 class TestSeasonAverages:
     """Tests for season_averages function."""
@@ -66,7 +76,7 @@ class TestSeasonAverages:
 
     def test_handles_empty_dataframe(self):
         """Should handle empty input gracefully."""
-        empty_df = pd.DataFrame()
+        empty_df = _EMPTY_DF
         result = season_averages(empty_df)
         assert result == {}
 
@@ -115,37 +125,25 @@ class TestScoringTrend:
         assert 'low' in result
         assert 'last_game' in result
 
-    def test_detects_upward_trend(self):
-        """Should detect upward trend when recent avg > previous avg * 1.1."""
-        fake_games = pd.DataFrame({
-            'points': [30, 28, 26, 24, 22, 18, 16, 14, 12, 10],
-        })
-
-        result = scoring_trend(fake_games)
-
-        assert result['direction'] == 'up'
-        assert result['recent_avg'] > result['average']
-
-    def test_detects_downward_trend(self):
-        """Should detect downward trend when recent avg < previous avg * 0.9."""
-        fake_games = pd.DataFrame({
-            'points': [10, 12, 14, 16, 18, 22, 24, 26, 28, 30],
-        })
+    @pytest.mark.parametrize("points, expected", [
+        # Recent avg > previous avg * 1.1
+        ([30, 28, 26, 24, 22, 18, 16, 14, 12, 10], 'up'),
+        # Recent avg < previous avg * 0.9
+        ([10, 12, 14, 16, 18, 22, 24, 26, 28, 30], 'down'),
+        # Change within 10%
+        ([20, 21, 19, 20, 21, 20, 19, 21, 20, 19], 'stable'),
+    ])
+    def test_detects_trend_direction(self, points, expected):
+        """Should compare the last 5 games against the 5 before them."""
+        fake_games = pd.DataFrame({'points': points})
 
         result = scoring_trend(fake_games)
 
-        assert result['direction'] == 'down'
-        assert result['recent_avg'] < result['average']
-
-    def test_detects_stable_trend(self):
-        """Should detect stable trend when change is within 10%."""
-        fake_games = pd.DataFrame({
-            'points': [20, 21, 19, 20, 21, 20, 19, 21, 20, 19],
-        })
-
-        result = scoring_trend(fake_games)
-
-        assert result['direction'] == 'stable'
+        assert result['direction'] == expected
+        if expected == 'up':
+            assert result['recent_avg'] > result['average']
+        elif expected == 'down':
+            assert result['recent_avg'] < result['average']
 
     def test_handles_less_than_5_games(self):
         """Should handle cases with fewer than 5 games."""
@@ -161,7 +159,7 @@ class TestScoringTrend:
 
     def test_handles_empty_dataframe(self):
         """Should handle empty input gracefully."""
-        empty_df = pd.DataFrame()
+        empty_df = _EMPTY_DF
         result = scoring_trend(empty_df)
         assert result == {}
 
@@ -178,23 +176,9 @@ class TestScoringTrend:
 class TestTopPerformers:
     """Tests for top_performers function."""
 
-    def test_returns_list(self):
+    def test_returns_list(self, sample_box_score):
         """Should return a list."""
-        fake_box = pd.DataFrame({
-            'personId': [1, 2, 3],
-            'name': ['Player A', 'Player B', 'Player C'],
-            'firstName': ['Player', 'Player', 'Player'],
-            'familyName': ['A', 'B', 'C'],
-            'points': [20, 15, 10],
-            'reboundsTotal': [5, 6, 7],
-            'assists': [3, 4, 5],
-            'steals': [1, 2, 1],
-            'blocks': [0, 1, 0],
-            'fieldGoalsMade': [8, 6, 4],
-            'fieldGoalsAttempted': [15, 12, 10],
-        })
-
-        result = top_performers(fake_box)
+        result = top_performers(sample_box_score)
 
         assert isinstance(result, list)
         assert len(result) == 3
@@ -222,25 +206,16 @@ class TestTopPerformers:
         assert result[2]['points'] == 10
         assert result[0]['name'] == 'Player B'
 
-    def test_returns_expected_keys(self):
-        """Should return dicts with expected keys."""
-        fake_box = pd.DataFrame({
-            'personId': [1],
-            'name': ['Player A'],
-            'firstName': ['Player'],
-            'familyName': ['A'],
-            'points': [20],
-            'reboundsTotal': [5],
-            'assists': [3],
-            'steals': [1],
-            'blocks': [0],
-            'fieldGoalsMade': [8],
-            'fieldGoalsAttempted': [15],
-        })
+    def test_limit_returns_top_players(self, sample_box_score):
+        """Should return only the top `limit` players, in rank order."""
+        result = top_performers(sample_box_score, limit=2)
 
-        result = top_performers(fake_box)
+        assert [p['name'] for p in result] == ['Player A', 'Player B']
+
+    def test_returns_expected_keys(self, sample_box_score):
+        """Should return dicts with expected keys."""
+        result = top_performers(sample_box_score)
 
-        assert len(result) == 1
         player = result[0]
 
         expected_keys = [
@@ -253,7 +228,7 @@ class TestTopPerformers:
 
     def test_handles_empty_dataframe(self):
         """Should handle empty input gracefully."""
-        empty_df = pd.DataFrame()
+        empty_df = _EMPTY_DF
         result = top_performers(empty_df)
         assert result == []
 
@@ -298,8 +273,7 @@ class TestEfficiencyMetrics:
 
         result = efficiency_metrics(fake_games)
 
-        expected_ts = 30 / (2 * (20 + 0.44 * 4)) * 100
-        assert result['ts_pct'] == pytest.approx(expected_ts, rel=0.01)
+        assert result['ts_pct'] == 68.9  # rounded to one decimal
 
     def test_calculates_efg_pct_correctly(self):
         """Should calculate effective FG % correctly."""
@@ -314,12 +288,11 @@ class TestEfficiencyMetrics:
 
         result = efficiency_metrics(fake_games)
 
-        expected_efg = (12 + 0.5 * 2) / 20 * 100
-        assert result['efg_pct'] == pytest.approx(expected_efg, rel=0.01)
+        assert result['efg_pct'] == 65.0
 
     def test_handles_empty_dataframe(self):
         """Should handle empty input gracefully."""
-        empty_df = pd.DataFrame()
+        empty_df = _EMPTY_DF
         result = efficiency_metrics(empty_df)
         assert result == {}
 
@@ -354,7 +327,7 @@ class TestGameEfficiency:
 
     def test_handles_empty_dataframe(self):
         """Should handle empty input gracefully."""
-        empty_df = pd.DataFrame()
+        empty_df = _EMPTY_DF
         result = game_efficiency(empty_df)
         assert result.empty
 
@@ -371,8 +344,7 @@ class TestGameEfficiency:
         result = game_efficiency(fake_games)
 
         # Game 1: 20 / (2 * (15 + 0.44 * 4)) = 20 / 33.52 = 59.7%
-        expected_ts_1 = 20 / (2 * (15 + 0.44 * 4)) * 100
-        assert result.iloc[0]['ts_pct'] == pytest.approx(expected_ts_1, rel=0.01)
+        assert result.at[0, 'ts_pct'] == 59.7  # rounded to one decimal
 
     def test_handles_missing_ft_attempted(self):
         """Should handle missing ft_attempted column."""
@@ -411,7 +383,7 @@ class TestRollingAverages:
 
     def test_handles_empty_dataframe(self):
         """Should handle empty input gracefully."""
-        empty_df = pd.DataFrame()
+        empty_df = _EMPTY_DF
         result = rolling_averages(empty_df)
         assert result.empty
 
@@ -427,9 +399,8 @@ class TestRollingAverages:
         # After reversal (oldest first): [10, 20, 30]
         # Roll 2: [10, 15, 25] (min_periods=1)
         # After re-reversal (most recent first): [25, 15, 10]
-        assert result.iloc[0]['points_roll_2'] == 25.0  # avg of 30, 20
-        assert result.iloc[1]['points_roll_2'] == 15.0  # avg of 20, 10
-        assert result.iloc[2]['points_roll_2'] == 10.0  # just 10
+        # avg of 30, 20; avg of 20, 10; just 10
+        np.testing.assert_array_equal(result['points_roll_2'].to_numpy(), [25.0, 15.0, 10.0])
 
     def test_skips_missing_metric(self):
         """Should skip metrics not in DataFrame."""
@@ -458,7 +429,7 @@ class TestCumulativePointDifferential:
 
     def test_handles_empty_dataframe(self):
         """Should handle empty input gracefully."""
-        empty_df = pd.DataFrame()
+        empty_df = _EMPTY_DF
 
         result = cumulative_point_differential(empty_df)
 
@@ -490,7 +461,7 @@ class TestCumulativeRecordDelta:
 
     def test_handles_empty_dataframe(self):
         """Should handle empty input gracefully."""
-        empty_df = pd.DataFrame()
+        empty_df = _EMPTY_DF
 
         result = cumulative_record_delta(empty_df)
 
@@ -525,29 +496,21 @@ class TestConsistencyScore:
         assert 'high' in result['points']
         assert 'low' in result['points']
 
-    def test_categorizes_very_consistent(self):
-        """Should categorize CV < 20% as very_consistent."""
-        fake_games = pd.DataFrame({
-            'points': [20, 21, 20, 19, 20],  # Low variation
-        })
-
-        result = consistency_score(fake_games, metrics=['points'])
-
-        assert result['points']['category'] == 'very_consistent'
-
-    def test_categorizes_volatile(self):
-        """Should categorize CV > 50% as volatile."""
-        fake_games = pd.DataFrame({
-            'points': [5, 40, 8, 35, 10],  # High variation
-        })
+    @pytest.mark.parametrize("points, expected", [
+        ([20, 21, 20, 19, 20], 'very_consistent'),  # CV < 20%
+        ([5, 40, 8, 35, 10], 'volatile'),  # CV > 50%
+    ])
+    def test_categorizes_by_coefficient_of_variation(self, points, expected):
+        """Should bucket each metric by its coefficient of variation."""
+        fake_games = pd.DataFrame({'points': points})
 
         result = consistency_score(fake_games, metrics=['points'])
 
-        assert result['points']['category'] == 'volatile'
+        assert result['points']['category'] == expected
 
     def test_handles_empty_dataframe(self):
         """Should handle empty input gracefully."""
-        empty_df = pd.DataFrame()
+        empty_df = _EMPTY_DF
         result = consistency_score(empty_df)
         assert result == {}
 
@@ -601,7 +564,7 @@ class TestPointsPerShot:
 
         result = points_per_shot(fake_shots)
 
-        assert result['pps'] == pytest.approx(5 / 3, rel=0.01)
+        assert result['pps'] == 1.667  # rounded to three decimals
         assert result['total_points'] == 5
         assert result['total_shots'] == 3
 
@@ -654,29 +617,21 @@ class TestPointsPerShot:
 
     def test_handles_empty_dataframe(self):
         """Should handle empty input gracefully."""
-        empty_df = pd.DataFrame()
+        empty_df = _EMPTY_DF
         result = points_per_shot(empty_df)
         assert result == {}
 
-    def test_handles_missing_columns(self):
-        """Should return empty dict if required columns missing."""
-        fake_shots = pd.DataFrame({
-            'shot_made': [True, False],
-            # Missing 'shot_type'
-        })
-
-        result = points_per_shot(fake_shots)
-        assert result == {}
-
-    def test_handles_missing_zone_column_with_by_zone(self):
-        """Should return empty dict if shot_zone missing when by_zone=True."""
-        fake_shots = pd.DataFrame({
-            'shot_made': [True, False],
-            'shot_type': ['2PT', '3PT'],
-            # Missing 'shot_zone'
-        })
-
-        result = points_per_shot(fake_shots, by_zone=True)
+    @pytest.mark.parametrize("columns, by_zone", [
+        # Missing 'shot_type'
+        ({'shot_made': [True, False]}, False),
+        # Missing 'shot_zone', which only by_zone=True requires
+        ({'shot_made': [True, False], 'shot_type': ['2PT', '3PT']}, True),
+    ])
+    def test_handles_missing_columns(self, columns, by_zone):
+        """Should return empty dict if a required column is missing."""
+        fake_shots = pd.DataFrame(columns)
+
+        result = points_per_shot(fake_shots, by_zone=by_zone)
         assert result == {}
 
     def test_excludes_backcourt_by_default(self):
@@ -740,12 +695,12 @@ class TestHighValueZoneUsage:
 
         result = high_value_zone_usage(fake_shots)
 
-        chi_row = result[result['team_abbr'] == 'CHI'].iloc[0]
-        assert chi_row['high_value_pct'] == 50.0  # 2/4 = 50%
-        assert chi_row['restricted_area_pct'] == 25.0  # 1/4 = 25%
-        assert chi_row['three_point_pct'] == 25.0  # 1/4 = 25%
-        assert chi_row['low_value_pct'] == 50.0  # 2/4 = 50%
-        assert chi_row['total_shots'] == 4
+        teams = _by_team(result)
+        assert teams.at['CHI', 'high_value_pct'] == 50.0  # 2/4 = 50%
+        assert teams.at['CHI', 'restricted_area_pct'] == 25.0  # 1/4 = 25%
+        assert teams.at['CHI', 'three_point_pct'] == 25.0  # 1/4 = 25%
+        assert teams.at['CHI', 'low_value_pct'] == 50.0  # 2/4 = 50%
+        assert teams.at['CHI', 'total_shots'] == 4
 
     def test_ranks_teams_correctly(self):
         """Should rank teams by high-value usage (highest first)."""
@@ -761,29 +716,23 @@ class TestHighValueZoneUsage:
         result = high_value_zone_usage(fake_shots)
 
         # LAL should be rank 1 (100%), CHI rank 2 (50%), BOS rank 3 (0%)
-        assert result.iloc[0]['team_abbr'] == 'LAL'
-        assert result.iloc[0]['rank'] == 1
-        assert result.iloc[0]['high_value_pct'] == 100.0
-
-        chi_row = result[result['team_abbr'] == 'CHI'].iloc[0]
-        assert chi_row['rank'] == 2
-
-        bos_row = result[result['team_abbr'] == 'BOS'].iloc[0]
-        assert bos_row['rank'] == 3
-        assert bos_row['high_value_pct'] == 0.0
+        np.testing.assert_array_equal(result['team_abbr'].to_numpy(), ['LAL', 'CHI', 'BOS'])
+        np.testing.assert_array_equal(result['rank'].to_numpy(), [1, 2, 3])
+        np.testing.assert_array_equal(result['high_value_pct'].to_numpy(), [100.0, 50.0, 0.0])
 
     def test_handles_empty_dataframe(self):
         """Should return empty DataFrame for empty input."""
-        empty_df = pd.DataFrame()
+        empty_df = _EMPTY_DF
         result = high_value_zone_usage(empty_df)
         assert result.empty
 
-    def test_handles_missing_columns(self):
+    @pytest.mark.parametrize("columns", [
+        {'shot_zone': ['Restricted Area', 'Mid-Range']},  # Missing 'team_abbr'
+        {'team_abbr': ['CHI', 'CHI']},  # Missing 'shot_zone'
+    ])
+    def test_handles_missing_columns(self, columns):
         """Should return empty DataFrame if required columns missing."""
-        fake_shots = pd.DataFrame({
-            'shot_zone': ['Restricted Area', 'Mid-Range'],
-            # Missing 'team_abbr'
-        })
+        fake_shots = pd.DataFrame(columns)
 
         result = high_value_zone_usage(fake_shots)
         assert result.empty
@@ -798,9 +747,9 @@ class TestHighValueZoneUsage:
         # Custom: only Mid-Range is high value
         result = high_value_zone_usage(fake_shots, high_value_zones=['Mid-Range'])
 
-        chi_row = result[result['team_abbr'] == 'CHI'].iloc[0]
-        assert chi_row['high_value_pct'] == 75.0  # 3/4 = 75%
-        assert chi_row['low_value_pct'] == 25.0  # 1/4 = 25%
+        teams = _by_team(result)
+        assert teams.at['CHI', 'high_value_pct'] == 75.0  # 3/4 = 75%
+        assert teams.at['CHI', 'low_value_pct'] == 25.0  # 1/4 = 25%
 
     def test_excludes_backcourt_by_default(self):
         """Should exclude Backcourt shots by default."""
@@ -811,9 +760,9 @@ class TestHighValueZoneUsage:
 
         result = high_value_zone_usage(fake_shots)
 
-        chi_row = result[result['team_abbr'] == 'CHI'].iloc[0]
-        assert chi_row['total_shots'] == 2  # Backcourt excluded
-        assert chi_row['high_value_pct'] == 50.0  # 1 Restricted / 2 total
+        teams = _by_team(result)
+        assert teams.at['CHI', 'total_shots'] == 2  # Backcourt excluded
+        assert teams.at['CHI', 'high_value_pct'] == 50.0  # 1 Restricted / 2 total
 
     def test_includes_backcourt_when_disabled(self):
         """Should include Backcourt when exclude_backcourt=False."""
@@ -824,8 +773,8 @@ class TestHighValueZoneUsage:
 
         result = high_value_zone_usage(fake_shots, exclude_backcourt=False)
 
-        chi_row = result[result['team_abbr'] == 'CHI'].iloc[0]
-        assert chi_row['total_shots'] == 3  # Backcourt included
+        teams = _by_team(result)
+        assert teams.at['CHI', 'total_shots'] == 3  # Backcourt included
 
 
 class TestZoneVolumeLeaders:
@@ -901,5 +850,28 @@ class TestZoneVolumeLeaders:
 
     def test_handles_empty_dataframe(self):
         """Should return empty dict for empty input."""
-        result = zone_volume_leaders(pd.DataFrame())
+        result = zone_volume_leaders(_EMPTY_DF)
         assert result == {}
+
+
+class TestGameZoneStats:
+    """Tests for game_zone_stats function."""
+
+    def test_counts_makes_and_attempts_per_zone(self):
+        """Should tally each zone once, in first-seen order, skipping missing zones."""
+        shots = pd.DataFrame({
+            'shot_zone': ['Mid-Range', 'Restricted Area', None, 'Mid-Range', 'Restricted Area'],
+            'shot_made': [True, False, True, True, True],
+        })
+
+        result = game_zone_stats(shots)
+
+        assert list(result) == ['Mid-Range', 'Restricted Area']
+        assert result['Mid-Range'] == {
+            'made': 2, 'attempted': 2, 'pct': 100.0, 'formatted': '2/2 (100.0%)'
+        }
+        assert result['Restricted Area']['formatted'] == '1/2 (50.0%)'
+
+    def test_handles_empty_dataframe(self):
+        """Should return empty dict for empty input."""
+        assert game_zone_stats(_EMPTY_DF) == {}